@@ -23,6 +23,7 @@ Local testing:
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
 import logging
 import os
@@ -32,6 +33,9 @@ from typing import Any
 
 import aiohttp
 import boto3
+import numpy as np
+import orjson
+import pandas as pd
 from botocore.config import Config
 
 # Configure logging
@@ -124,7 +128,7 @@ async def _discover_record_types(
                 logger.warning(f"Could not discover record types: status {resp.status}")
                 return {}
 
-            data = await resp.json()
+            data = await resp.json(loads=orjson.loads)
             if not isinstance(data, list):
                 return {}
 
@@ -164,7 +168,7 @@ async def _fetch_year_bulk(
                         logger.warning(f"Year {year} returned status {resp.status}")
                         return []
 
-                    data = await resp.json()
+                    data = await resp.json(loads=orjson.loads)
                     records = data if isinstance(data, list) else [data]
 
                     extracted_at = datetime.now(timezone.utc).isoformat()
@@ -232,7 +236,7 @@ async def _extract_bulk(start_year: int, end_year: int) -> dict:
         # Step 2: Fetch countries for reference
         logger.info("Fetching countries...")
         async with session.get(f"{GFN_API_BASE_URL}/countries", auth=auth) as resp:
-            countries_data = await resp.json()
+            countries_data = await resp.json(loads=orjson.loads)
 
         countries = [
             {
@@ -328,7 +332,7 @@ def handler_extract(event: dict, context: Any = None) -> dict:
     s3.put_object(
         Bucket=S3_BUCKET,
         Key=s3_key,
-        Body=json.dumps(result).encode(),
+        Body=orjson.dumps(result),
         ContentType="application/json",
         Metadata={
             "records_count": str(len(records)),
@@ -375,6 +379,24 @@ def handler_extract(event: dict, context: Any = None) -> dict:
 # ============================================================================
 
 
+def _carbon_pct_of_total(frame: pd.DataFrame) -> list[float | None]:
+    """
+    Compute carbon as a percentage of total value for each row of ``frame``.
+
+    Runs as one NumPy pass over the carbon/value columns instead of per-row
+    Python arithmetic. Rows without carbon or with a non-positive value get None.
+    """
+    carbon = frame["carbon"].to_numpy(dtype=np.float64, na_value=np.nan)
+    value = frame["value"].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    valid = ~np.isnan(carbon) & (value > 0)
+    pct = np.full_like(carbon, np.nan)
+    np.divide(carbon, value, out=pct, where=valid)
+    pct = np.round(pct * 100, 2)
+
+    return [None if np.isnan(p) else p for p in pct.tolist()]
+
+
 def handler_transform(event: dict, context: Any = None) -> dict:
     """
     Lambda handler for transformation.
@@ -409,7 +431,7 @@ def handler_transform(event: dict, context: Any = None) -> dict:
     # Read raw data from S3
     s3 = get_s3_client()
     response = s3.get_object(Bucket=s3_bucket, Key=s3_key)
-    raw_data = json.loads(response["Body"].read().decode())
+    raw_data = orjson.loads(response["Body"].read())
 
     # Handle both old format (list) and new format (dict with keys)
     if isinstance(raw_data, dict):
@@ -424,38 +446,26 @@ def handler_transform(event: dict, context: Any = None) -> dict:
     logger.info(f"Read {len(footprint_data):,} records from s3://{s3_bucket}/{s3_key}")
 
     # Transform: validate, enrich, deduplicate
-    transformed = []
-    seen = set()
-    invalid_count = 0
-
-    for record in footprint_data:
-        # Validate required fields
-        if not record.get("country_code") or not record.get("year"):
-            invalid_count += 1
-            continue
-
-        # Deduplicate by (country_code, year, record_type)
-        record_type = record.get("record_type", "unknown")
-        key = (record["country_code"], record["year"], record_type)
-        if key in seen:
-            continue
-        seen.add(key)
-
-        # Enrich: add transformed timestamp and calculate derived fields
-        enriched = {
-            **record,
-            "transformed_at": datetime.now(timezone.utc).isoformat(),
-        }
+    transformed_at = datetime.now(timezone.utc).isoformat()
 
-        # Calculate carbon percentage for footprint types
-        carbon = record.get("carbon")
-        value = record.get("value")
-        if carbon is not None and value and value > 0:
-            enriched["carbon_pct_of_total"] = round(carbon / value * 100, 2)
-        else:
-            enriched["carbon_pct_of_total"] = None
-
-        transformed.append(enriched)
+    # Validate, deduplicate by (country_code, year, record_type) and compute
+    # carbon_pct_of_total from one frame over just the fields involved; the
+    # original record dicts are then enriched in a single pass
+    frame = pd.DataFrame(
+        footprint_data, columns=["country_code", "year", "record_type", "carbon", "value"]
+    )
+    required = frame[["country_code", "year"]]
+    invalid = (required.isna() | required.isin(["", 0])).any(axis=1)
+    keys = frame[["country_code", "year", "record_type"]].fillna({"record_type": "unknown"})
+    keep = ~invalid & ~keys.duplicated(keep="first")
+    invalid_count = int(invalid.sum())
+
+    transformed = [
+        {**record, "transformed_at": transformed_at, "carbon_pct_of_total": pct}
+        for record, pct in zip(
+            itertools.compress(footprint_data, keep.tolist()), _carbon_pct_of_total(frame[keep])
+        )
+    ]
 
     logger.info(
         f"Transformed {len(transformed):,} records "
@@ -471,7 +481,7 @@ def handler_transform(event: dict, context: Any = None) -> dict:
             "source_key": s3_key,
             "records_transformed": len(transformed),
             "records_removed": len(footprint_data) - len(transformed),
-            "transformed_at": datetime.now(timezone.utc).isoformat(),
+            "transformed_at": transformed_at,
         },
     }
 
@@ -482,7 +492,7 @@ def handler_transform(event: dict, context: Any = None) -> dict:
     s3.put_object(
         Bucket=s3_bucket,
         Key=output_key,
-        Body=json.dumps(output_data).encode(),
+        Body=orjson.dumps(output_data),
         ContentType="application/json",
         Metadata={
             "records_count": str(len(transformed)),
@@ -556,7 +566,7 @@ def handler_load(event: dict, context: Any = None) -> dict:
     # Read processed data
     s3 = get_s3_client()
     response = s3.get_object(Bucket=s3_bucket, Key=s3_key)
-    raw_data = json.loads(response["Body"].read().decode())
+    raw_data = orjson.loads(response["Body"].read())
 
     # Handle both formats
     if isinstance(raw_data, dict):
@@ -596,6 +606,27 @@ def handler_load(event: dict, context: Any = None) -> dict:
     }
 
 
+DUCKDB_FOOTPRINT_COLUMNS = (
+    "country_code",
+    "country_name",
+    "short_name",
+    "iso_alpha2",
+    "year",
+    "record_type",
+    "crop_land",
+    "grazing_land",
+    "forest_land",
+    "fishing_ground",
+    "builtup_land",
+    "carbon",
+    "value",
+    "score",
+    "carbon_pct_of_total",
+    "extracted_at",
+    "transformed_at",
+)
+
+
 def _load_to_duckdb_bulk(data: list[dict]) -> int:
     """Load data to local DuckDB with new schema."""
     import duckdb
@@ -628,36 +659,22 @@ def _load_to_duckdb_bulk(data: list[dict]) -> int:
     """)
 
     if data:
-        # Use batch insert for efficiency
-        conn.executemany(
-            """
-            INSERT OR REPLACE INTO footprint_data VALUES (
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-            )
-        """,
-            [
-                (
-                    r.get("country_code"),
-                    r.get("country_name"),
-                    r.get("short_name"),
-                    r.get("iso_alpha2"),
-                    r.get("year"),
-                    r.get("record_type"),
-                    r.get("crop_land"),
-                    r.get("grazing_land"),
-                    r.get("forest_land"),
-                    r.get("fishing_ground"),
-                    r.get("builtup_land"),
-                    r.get("carbon"),
-                    r.get("value"),
-                    r.get("score"),
-                    r.get("carbon_pct_of_total"),
-                    r.get("extracted_at"),
-                    r.get("transformed_at"),
-                )
-                for r in data
-            ],
+        # Register the batch as a DataFrame so DuckDB ingests it column-wise in
+        # one INSERT ... SELECT instead of binding parameters row by row
+        stage = pd.DataFrame(data, columns=list(DUCKDB_FOOTPRINT_COLUMNS))
+        # A single INSERT rejects repeated keys within the batch; keep the last
+        # row per key as the row-wise INSERT OR REPLACE did (legacy list
+        # payloads reach here without going through the transform's dedup)
+        stage = stage.drop_duplicates(subset=["country_code", "year", "record_type"], keep="last")
+        # DuckDB's pandas scan does not understand the pandas 3 "str" dtype
+        text_columns = [c for c in stage.columns if pd.api.types.is_string_dtype(stage[c])]
+        stage = stage.astype(dict.fromkeys(text_columns, object))
+        conn.register("stage", stage)
+        conn.execute(
+            "INSERT OR REPLACE INTO footprint_data "
+            f"SELECT {', '.join(DUCKDB_FOOTPRINT_COLUMNS)} FROM stage"
         )
+        conn.unregister("stage")
 
     conn.execute("SELECT COUNT(*) FROM footprint_data").fetchone()[0]
     conn.close()
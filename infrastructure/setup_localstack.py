@@ -48,6 +48,10 @@ SQS_LOAD_QUEUE = "gfn-load-queue"
 SQS_DLQ = "gfn-dlq"
 SNS_NOTIFICATIONS = "gfn-pipeline-notifications"
 
+# Lambda runtime the package is built for (wheels must match it, not the host)
+LAMBDA_PYTHON_VERSION = "3.11"
+LAMBDA_PLATFORM = "x86_64-manylinux2014"
+
 # Lambda configuration
 LAMBDA_FUNCTIONS = {
     "gfn-extract": {
@@ -306,14 +310,29 @@ def create_lambda_package(include_dependencies: bool = True) -> str:
         dependencies = [
             "aiohttp",
             "boto3",
+            "numpy",
+            "orjson",
+            "pandas",
             "pydantic",
             "pydantic-settings",
             "python-dotenv",
         ]
 
-        # Install to package directory
+        # Install to package directory, resolving Linux wheels for the Lambda
+        # runtime so numpy/pandas/orjson binaries also work when packaged on macOS
         result = subprocess.run(
-            ["uv", "pip", "install", "--target", package_dir] + dependencies,
+            [
+                "uv",
+                "pip",
+                "install",
+                "--target",
+                package_dir,
+                "--python-platform",
+                LAMBDA_PLATFORM,
+                "--python-version",
+                LAMBDA_PYTHON_VERSION,
+            ]
+            + dependencies,
             capture_output=True,
             text=True,
             cwd=str(project_root),
@@ -383,7 +402,7 @@ def setup_lambda_functions(role_arn: str):
                     # Create new function
                     lambda_client.create_function(
                         FunctionName=function_name,
-                        Runtime="python3.11",
+                        Runtime=f"python{LAMBDA_PYTHON_VERSION}",
                         Role=role_arn,
                         Handler=config["handler"],
                         Code={"ZipFile": zip_content},
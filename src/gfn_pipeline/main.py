@@ -33,7 +33,7 @@ Environment Variables:
 from __future__ import annotations
 
 import argparse
-import asyncio
+import io
 import json
 import logging
 import os
@@ -44,6 +44,8 @@ from pathlib import Path
 from typing import Any, Iterator
 
 import dlt
+import orjson
+import pandas as pd
 from dlt.common.schema.typing import TColumnSchema
 from dotenv import load_dotenv
 
@@ -107,6 +109,12 @@ COUNTRIES_COLUMNS: dict[str, TColumnSchema] = {
 # =============================================================================
 
 
+# Multi-year raw/staged payloads run to tens of MB: upload them as
+# concurrent multipart chunks instead of one single-threaded PUT
+S3_MULTIPART_CHUNK_BYTES = 8 * 1024 * 1024
+S3_MAX_CONCURRENCY = 10
+
+
 class S3DataLake:
     """S3 Data Lake for raw and staged data storage."""
 
@@ -136,17 +144,32 @@ class S3DataLake:
             self._client = boto3.client("s3", **s3_config)
         return self._client
 
+    def _upload_json(self, key: str, body: bytes, metadata: dict[str, str]) -> None:
+        """Upload a JSON payload, switching to multipart uploads for large bodies."""
+        from boto3.s3.transfer import TransferConfig
+
+        self.client.upload_fileobj(
+            io.BytesIO(body),
+            self.bucket,
+            key,
+            ExtraArgs={"ContentType": "application/json", "Metadata": metadata},
+            Config=TransferConfig(
+                multipart_threshold=S3_MULTIPART_CHUNK_BYTES,
+                multipart_chunksize=S3_MULTIPART_CHUNK_BYTES,
+                max_concurrency=S3_MAX_CONCURRENCY,
+                use_threads=True,
+            ),
+        )
+
     def store_raw(self, data: dict, prefix: str = "raw") -> str:
         """Store raw extracted data to S3."""
         timestamp = datetime.now(timezone.utc)
         key = f"{prefix}/gfn_footprint_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
 
-        self.client.put_object(
-            Bucket=self.bucket,
-            Key=key,
-            Body=json.dumps(data, default=str).encode(),
-            ContentType="application/json",
-            Metadata={
+        self._upload_json(
+            key,
+            orjson.dumps(data, default=str),
+            metadata={
                 "extracted_at": timestamp.isoformat(),
                 "record_count": str(len(data.get("footprint_data", []))),
             },
@@ -159,12 +182,10 @@ class S3DataLake:
         timestamp = datetime.now(timezone.utc)
         key = f"{prefix}/gfn_footprint_{timestamp.strftime('%Y%m%d_%H%M%S')}_staged.json"
 
-        self.client.put_object(
-            Bucket=self.bucket,
-            Key=key,
-            Body=json.dumps(data, default=str).encode(),
-            ContentType="application/json",
-            Metadata={
+        self._upload_json(
+            key,
+            orjson.dumps(data, default=str),
+            metadata={
                 "staged_at": timestamp.isoformat(),
                 "record_count": str(len(data.get("footprint_data", []))),
             },
@@ -179,7 +200,7 @@ class S3DataLake:
             key = key.split("/", 3)[3]
 
         response = self.client.get_object(Bucket=self.bucket, Key=key)
-        return json.loads(response["Body"].read().decode())
+        return orjson.loads(response["Body"].read())
 
 
 # =============================================================================
@@ -271,6 +292,11 @@ def record_types_resource(record_types: list[dict]) -> Iterator[dict]:
     yield from record_types
 
 
+# Records are handed to dlt in lists of this size rather than one dict per yield
+# (same batch size as pipeline_async, which main only imports lazily)
+RESOURCE_BATCH_SIZE = 10_000
+
+
 @dlt.resource(
     name="footprint_data",
     write_disposition="merge",
@@ -281,7 +307,7 @@ def footprint_data_resource(
     data: list[dict],
     incremental_key: str = "year",
     enable_contracts: bool = False,
-) -> Iterator[dict]:
+) -> Iterator[list[dict]]:
     """
     Footprint data with incremental loading and schema evolution.
 
@@ -297,6 +323,8 @@ def footprint_data_resource(
     """
     logger.info(f"Processing {len(data):,} footprint records")
 
+    # Yield valid records in batches so dlt can process them in bulk
+    batch = []
     for record in data:
         # Always validate required fields (schema has nullable: False for these)
         required = ["country_code", "year", "record_type"]
@@ -306,7 +334,13 @@ def footprint_data_resource(
             )
             continue
 
-        yield record
+        batch.append(record)
+        if len(batch) >= RESOURCE_BATCH_SIZE:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
 
 
 # =============================================================================
@@ -373,6 +407,17 @@ def calculate_incremental_range(
 # =============================================================================
 
 
+def _first_complete_records(records: list[dict], key_cols: list[str]) -> list[bool]:
+    """
+    Mask of records to keep: every key column present (truthy) and the
+    first occurrence of each key. Only the key columns are framed, so the
+    original record dicts pass through untouched.
+    """
+    keys = pd.DataFrame(records, columns=key_cols)
+    complete = ~(keys.isna() | keys.isin(["", 0])).any(axis=1)
+    return (complete & ~keys.duplicated(keep="first")).tolist()
+
+
 class DltPipelineRunner:
     """
     Production pipeline runner combining dlt features with S3 data lake.
@@ -557,45 +602,32 @@ class DltPipelineRunner:
 
     def _extract(self, start_year: int, end_year: int) -> dict:
         """Extract data using async pipeline."""
-        from gfn_pipeline.pipeline_async import ExtractionConfig, extract_all_data
+        from gfn_pipeline.pipeline_async import ExtractionConfig, extract_all_data, run_async
 
         api_key = os.getenv("GFN_API_KEY")
         if not api_key:
             raise ValueError("GFN_API_KEY environment variable required")
 
         config = ExtractionConfig(api_key=api_key)
-        return asyncio.run(extract_all_data(config, start_year, end_year))
+        return run_async(extract_all_data(config, start_year, end_year))
 
     def _transform(self, data: dict) -> dict:
         """Transform and validate data."""
         transformed_at = datetime.now(timezone.utc).isoformat()
 
         # Transform countries
-        countries = []
-        seen_countries = set()
-        for c in data.get("countries", []):
-            if not c.get("country_code"):
-                continue
-            if c["country_code"] in seen_countries:
-                continue
-            seen_countries.add(c["country_code"])
-            countries.append({**c, "transformed_at": transformed_at})
-
-        # Transform footprint data
-        footprint_data = []
-        seen_records = set()
-        for r in data.get("footprint_data", []):
-            # Validate required fields
-            if not all([r.get("country_code"), r.get("year"), r.get("record_type")]):
-                continue
-
-            # Deduplicate
-            key = (r["country_code"], r["year"], r["record_type"])
-            if key in seen_records:
-                continue
-            seen_records.add(key)
-
-            footprint_data.append({**r, "transformed_at": transformed_at})
+        raw_countries = data.get("countries", [])
+        keep = _first_complete_records(raw_countries, ["country_code"])
+        countries = [
+            {**c, "transformed_at": transformed_at} for c, ok in zip(raw_countries, keep) if ok
+        ]
+
+        # Transform footprint data: validate required fields and deduplicate
+        raw_footprint = data.get("footprint_data", [])
+        keep = _first_complete_records(raw_footprint, ["country_code", "year", "record_type"])
+        footprint_data = [
+            {**r, "transformed_at": transformed_at} for r, ok in zip(raw_footprint, keep) if ok
+        ]
 
         return {
             "countries": countries,
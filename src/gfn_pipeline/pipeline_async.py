@@ -22,17 +22,27 @@ dictionary is only used when API discovery fails completely.
 from __future__ import annotations
 
 import asyncio
+import functools
+import json
 import logging
 import os
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Iterator
 
 import aiohttp
 import dlt
+import orjson
+import pyarrow as pa
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows/PyPy
+    uvloop = None
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -61,6 +71,17 @@ class ExtractionConfig:
             raise ValueError("API key required. Set GFN_API_KEY environment variable.")
 
 
+# Transient server-side errors worth retrying on the bulk endpoint
+RETRYABLE_STATUSES = frozenset({500, 502, 503, 504})
+
+
+def run_async(coro):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 # ============================================================================
 # Async Rate Limiter
 # ============================================================================
@@ -114,7 +135,7 @@ async def fetch_record_types_from_api(
                 logger.warning(f"Types endpoint returned status {resp.status}")
                 return {}
 
-            types_data = await resp.json()
+            types_data = await resp.json(loads=orjson.loads)
             return {
                 t["code"]: {
                     "name": t.get("name", ""),
@@ -147,7 +168,7 @@ async def discover_record_types_from_sample_year(
                 logger.warning(f"Sample year endpoint returned status {resp.status}")
                 return set()
 
-            data = await resp.json()
+            data = await resp.json(loads=orjson.loads)
             if not isinstance(data, list):
                 return set()
 
@@ -173,6 +194,23 @@ async def get_available_record_types(
     Returns:
         Dictionary mapping record type code to description
     """
+    record_types, _ = await _discover_available_record_types(session, auth, base_url)
+    return record_types
+
+
+async def _discover_available_record_types(
+    session: aiohttp.ClientSession,
+    auth: aiohttp.BasicAuth,
+    base_url: str,
+) -> tuple[dict[str, str], bool]:
+    """
+    Discover record types as in ``get_available_record_types``.
+
+    Returns:
+        Tuple of (record types, complete), where ``complete`` is False when
+        sample-year discovery failed and only the /types fallback was used.
+        Only complete results are worth persisting to the disk cache.
+    """
     # Fetch metadata from /types endpoint (parallel with discovery)
     types_task = fetch_record_types_from_api(session, auth, base_url)
     discovery_task = discover_record_types_from_sample_year(session, auth, base_url)
@@ -205,21 +243,60 @@ async def get_available_record_types(
             "Check API connectivity and credentials."
         )
 
-    return result
+    return result, bool(discovered_types)
+
 
+# Disk cache for discovered record types (shared across processes)
+RECORD_TYPES_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # 7 days
 
-# Synchronous wrapper with caching
-_cached_record_types: dict[str, str] | None = None
 
+def _record_types_cache_path() -> Path:
+    """Location of the on-disk record types cache (override with GFN_CACHE_DIR)."""
+    cache_dir = os.getenv("GFN_CACHE_DIR") or Path.home() / ".cache" / "gfn_pipeline"
+    return Path(cache_dir) / "record_types.json"
 
+
+def _load_record_types_cache(base_url: str) -> dict[str, str] | None:
+    """
+    Load record types from the disk cache.
+
+    Returns None if the cache is missing, expired, unreadable, or was
+    written for a different API base URL.
+    """
+    path = _record_types_cache_path()
+    try:
+        if time.time() - path.stat().st_mtime > RECORD_TYPES_CACHE_TTL_SECONDS:
+            return None
+        cached = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if cached.get("base_url") != base_url or not cached.get("record_types"):
+        return None
+    return cached["record_types"]
+
+
+def _save_record_types_cache(base_url: str, record_types: dict[str, str]) -> None:
+    """Atomically write record types to the disk cache (best effort)."""
+    path = _record_types_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"base_url": base_url, "record_types": record_types}))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write record types cache {path}: {e}")
+
+
+# Synchronous wrapper with caching (per api_key/base_url, in memory and on disk)
+@functools.lru_cache(maxsize=4)
 def get_record_types_sync(
     api_key: str, base_url: str = "https://api.footprintnetwork.org/v1"
 ) -> dict[str, str]:
-    """Synchronous wrapper to get record types (with caching)."""
-    global _cached_record_types
-
-    if _cached_record_types is not None:
-        return _cached_record_types
+    """Synchronous wrapper to get record types (cached in memory and on disk)."""
+    cached = _load_record_types_cache(base_url)
+    if cached:
+        return cached
 
     async def _fetch():
         auth = aiohttp.BasicAuth("", api_key)
@@ -227,22 +304,25 @@ def get_record_types_sync(
         timeout = aiohttp.ClientTimeout(total=30)
 
         async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-            return await get_available_record_types(session, auth, base_url)
+            return await _discover_available_record_types(session, auth, base_url)
 
     try:
-        _cached_record_types = asyncio.run(_fetch())
-        if not _cached_record_types:
+        record_types, complete = run_async(_fetch())
+        if not record_types:
             raise ValueError("No record types discovered from API")
-        return _cached_record_types
     except Exception as e:
         logger.error(f"Failed to fetch record types: {e}")
         raise
 
+    if complete:
+        _save_record_types_cache(base_url, record_types)
+    return record_types
+
 
 def clear_record_types_cache():
-    """Clear the cached record types."""
-    global _cached_record_types
-    _cached_record_types = None
+    """Clear the cached record types (in memory and on disk)."""
+    get_record_types_sync.cache_clear()
+    _record_types_cache_path().unlink(missing_ok=True)
 
 
 # ============================================================================
@@ -254,13 +334,14 @@ async def fetch_countries(
     session: aiohttp.ClientSession,
     auth: aiohttp.BasicAuth,
     base_url: str,
+    extracted_at: str | None = None,
 ) -> list[dict]:
     """Fetch all countries from the API."""
     async with session.get(f"{base_url}/countries", auth=auth) as resp:
         resp.raise_for_status()
-        countries = await resp.json()
+        countries = await resp.json(loads=orjson.loads)
 
-        extracted_at = datetime.now(timezone.utc).isoformat()
+        extracted_at = extracted_at or datetime.now(timezone.utc).isoformat()
         result = []
         for c in countries:
             country_code = c.get("countryCode")
@@ -287,6 +368,16 @@ async def fetch_countries(
         return result
 
 
+def _parse_country_code(code: Any) -> int | None:
+    """Safely parse country code to int (None for 'all', 'world', etc.)."""
+    if not code:
+        return None
+    try:
+        return int(code)
+    except (ValueError, TypeError):
+        return None
+
+
 async def fetch_year_all_data(
     session: aiohttp.ClientSession,
     auth: aiohttp.BasicAuth,
@@ -294,6 +385,7 @@ async def fetch_year_all_data(
     base_url: str,
     year: int,
     record_type_descriptions: dict[str, str],
+    extracted_at: str | None = None,
 ) -> list[dict]:
     """
     Fetch ALL data for ALL countries for a single year.
@@ -316,50 +408,60 @@ async def fetch_year_all_data(
                     await asyncio.sleep(retry_after)
                     continue
 
+                if resp.status in RETRYABLE_STATUSES and attempt < 2:
+                    logger.warning(f"Year {year} returned status {resp.status}, retrying...")
+                    await asyncio.sleep(2**attempt)
+                    continue
+
                 if resp.status != 200:
                     logger.warning(f"Year {year} returned status {resp.status}")
                     return []
 
-                data = await resp.json()
+                encoding = resp.headers.get("Content-Encoding", "identity")
+                logger.debug(f"Year {year} Content-Encoding: {encoding}")
+                data = await resp.json(loads=orjson.loads)
                 records = data if isinstance(data, list) else [data]
 
-                extracted_at = datetime.now(timezone.utc).isoformat()
-
-                def parse_country_code(code):
-                    """Safely parse country code to int."""
-                    if not code:
-                        return None
-                    try:
-                        return int(code)
-                    except (ValueError, TypeError):
-                        return None
-
-                return [
-                    {
-                        "country_code": parse_country_code(r.get("countryCode")),
-                        "country_name": r.get("countryName"),
-                        "short_name": r.get("shortName"),
-                        "iso_alpha2": r.get("isoa2"),
-                        "year": r.get("year"),
-                        "record_type": r.get("record"),
-                        "record_type_description": record_type_descriptions.get(
-                            r.get("record"), r.get("record")
-                        ),
-                        # Land use breakdown (in global hectares or hectares)
-                        "crop_land": r.get("cropLand"),
-                        "grazing_land": r.get("grazingLand"),
-                        "forest_land": r.get("forestLand"),
-                        "fishing_ground": r.get("fishingGround"),
-                        "builtup_land": r.get("builtupLand"),
-                        "carbon": r.get("carbon"),
-                        # Aggregate value
-                        "value": r.get("value"),
-                        "score": r.get("score"),
-                        "extracted_at": extracted_at,
-                    }
-                    for r in records
-                    if r.get("year") and parse_country_code(r.get("countryCode")) is not None
-                ]
+                extracted_at = extracted_at or datetime.now(timezone.utc).isoformat()
+                describe = record_type_descriptions.get
+
+                # ~200 countries x ~20 record types repeat across every row:
+                # share one str object per distinct value instead of one per row
+                strings: dict[Any, Any] = {}
+
+                def canonical(value: Any) -> Any:
+                    return strings.setdefault(value, value)
+
+                result = []
+                append = result.append
+                for r in records:
+                    country_code = _parse_country_code(r.get("countryCode"))
+                    if country_code is None or not r.get("year"):
+                        continue
+                    record_type = canonical(r.get("record"))
+                    append(
+                        {
+                            "country_code": country_code,
+                            "country_name": canonical(r.get("countryName")),
+                            "short_name": canonical(r.get("shortName")),
+                            "iso_alpha2": canonical(r.get("isoa2")),
+                            "year": r.get("year"),
+                            "record_type": record_type,
+                            "record_type_description": describe(record_type, record_type),
+                            # Land use breakdown (in global hectares or hectares)
+                            "crop_land": r.get("cropLand"),
+                            "grazing_land": r.get("grazingLand"),
+                            "forest_land": r.get("forestLand"),
+                            "fishing_ground": r.get("fishingGround"),
+                            "builtup_land": r.get("builtupLand"),
+                            "carbon": r.get("carbon"),
+                            # Aggregate value
+                            "value": r.get("value"),
+                            "score": canonical(r.get("score")),
+                            "extracted_at": extracted_at,
+                        }
+                    )
+                return result
 
         except asyncio.TimeoutError:
             logger.warning(f"Timeout for year {year}, attempt {attempt + 1}/3")
@@ -385,13 +487,22 @@ async def fetch_years_parallel(
     years: list[int],
     record_type_descriptions: dict[str, str],
     batch_size: int = 3,
+    record_types: list[str] | None = None,
+    extracted_at: str | None = None,
 ) -> list[dict]:
     """
-    Fetch multiple years in parallel batches for improved performance.
+    Fetch multiple years concurrently and collect them as they complete.
+
+    ``batch_size`` worker tasks pull years from a shared queue and hand each
+    year's records to the consumer through a bounded queue, so a slow year
+    never stalls the others and at most a few unconsumed years are held in
+    memory at once.
 
     Args:
         years: List of years to fetch
         batch_size: Number of years to fetch concurrently
+        record_types: Optional filter applied as each year arrives
+        extracted_at: Timestamp stamped on every record (default: per year)
 
     Returns:
         Combined list of all records from all years
@@ -399,33 +510,56 @@ async def fetch_years_parallel(
     all_records = []
     total_years = len(years)
     start_time = time.monotonic()
+    wanted = set(record_types) if record_types else None
 
-    # Process years in batches
-    for i in range(0, total_years, batch_size):
-        batch = years[i : i + batch_size]
-
-        # Fetch batch in parallel
-        tasks = [
-            fetch_year_all_data(
-                session, auth, rate_limiter, base_url, year, record_type_descriptions
-            )
-            for year in batch
-        ]
+    pending: asyncio.Queue[int] = asyncio.Queue()
+    for year in years:
+        pending.put_nowait(year)
+    results: asyncio.Queue[tuple[int, list[dict] | Exception]] = asyncio.Queue(maxsize=4)
 
-        results = await asyncio.gather(*tasks)
+    async def worker():
+        while True:
+            try:
+                year = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                records = await fetch_year_all_data(
+                    session,
+                    auth,
+                    rate_limiter,
+                    base_url,
+                    year,
+                    record_type_descriptions,
+                    extracted_at=extracted_at,
+                )
+            except Exception as e:
+                # Hand the error to the consumer, which would otherwise wait
+                # forever on a year this worker will never deliver
+                await results.put((year, e))
+                return
+            await results.put((year, records))
 
-        batch_records = 0
-        for year, records in zip(batch, results):
+    workers = [asyncio.create_task(worker()) for _ in range(min(batch_size, total_years))]
+    try:
+        for completed in range(1, total_years + 1):
+            year, records = await results.get()
+            if isinstance(records, Exception):
+                raise records
+            if wanted is not None:
+                records = [r for r in records if r["record_type"] in wanted]
             all_records.extend(records)
-            batch_records += len(records)
 
-        elapsed = time.monotonic() - start_time
-        completed = min(i + batch_size, total_years)
-        rate = completed / elapsed if elapsed > 0 else 0
-        print(
-            f"  Years {batch[0]}-{batch[-1]}: {batch_records:,} records "
-            f"(total: {len(all_records):,}) - {rate:.1f} years/s"
-        )
+            elapsed = time.monotonic() - start_time
+            rate = completed / elapsed if elapsed > 0 else 0
+            print(
+                f"  Year {year}: {len(records):,} records "
+                f"(total: {len(all_records):,}) - {rate:.1f} years/s"
+            )
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
 
     return all_records
 
@@ -462,9 +596,24 @@ async def extract_all_data(
     timeout = aiohttp.ClientTimeout(total=config.request_timeout)
 
     async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-        # Step 1: Discover available record types dynamically from API
-        print("Discovering available record types from API...")
-        available_types = await get_available_record_types(session, auth, config.api_base_url)
+        # Step 1: Discover available record types dynamically from API and
+        # fetch countries (reference data) concurrently - they are independent
+        # One timestamp per run, shared by every extracted row
+        extracted_at = datetime.now(timezone.utc).isoformat()
+        countries_task = fetch_countries(session, auth, config.api_base_url, extracted_at)
+        available_types = _load_record_types_cache(config.api_base_url)
+        if available_types:
+            print("Using cached record types (skipping API discovery)...")
+            countries = await countries_task
+        else:
+            print("Discovering available record types and fetching countries from API...")
+            (available_types, complete), countries = await asyncio.gather(
+                _discover_available_record_types(session, auth, config.api_base_url),
+                countries_task,
+            )
+            # Never pin the degraded /types-only fallback for the cache TTL
+            if complete:
+                _save_record_types_cache(config.api_base_url, available_types)
 
         if not available_types:
             raise ValueError(
@@ -476,9 +625,7 @@ async def extract_all_data(
         for rt in sorted(available_types.keys()):
             print(f"    - {rt}: {available_types[rt]}")
 
-        # Step 2: Fetch countries (for reference data)
-        print("\nFetching countries...")
-        countries = await fetch_countries(session, auth, config.api_base_url)
+        # Step 2: Countries were fetched alongside discovery
         print(f"  Found {len(countries)} countries")
 
         # Step 3: Fetch data year by year using bulk endpoint (with parallel batching)
@@ -501,25 +648,27 @@ async def extract_all_data(
             years,
             available_types,
             batch_size=config.parallel_year_batches,
+            record_types=record_types,
+            extracted_at=extracted_at,
         )
 
-        # Filter by record_types if specified
         if record_types:
-            original_count = len(all_records)
-            all_records = [r for r in all_records if r["record_type"] in record_types]
-            print(
-                f"\n  Filtered to {len(record_types)} types: {len(all_records):,} records "
-                f"(from {original_count:,})"
-            )
+            print(f"\n  Filtered to {len(record_types)} types: {len(all_records):,} records")
 
-        # Collect unique record types found
-        found_types = {r["record_type"] for r in all_records if r.get("record_type")}
+        # Collect unique record types and countries found in a single pass
+        found_types: set[str] = set()
+        countries_with_data: set[int] = set()
+        add_type, add_country = found_types.add, countries_with_data.add
+        for r in all_records:
+            if r["record_type"]:
+                add_type(r["record_type"])
+            add_country(r["country_code"])
 
         elapsed = time.monotonic() - start_time
         print(f"\nExtraction complete in {elapsed:.1f}s")
         print(f"  Total records: {len(all_records):,}")
         print(f"  Record types found: {len(found_types)}")
-        print(f"  Countries with data: {len(set(r['country_code'] for r in all_records))}")
+        print(f"  Countries with data: {len(countries_with_data)}")
 
         return {
             "countries": countries,
@@ -560,6 +709,89 @@ ALL_RECORD_TYPES = {}  # Populated on first use - call get_all_record_types() in
 # ============================================================================
 
 
+# Records are handed to dlt in lists of this size rather than one dict per yield,
+# which lets dlt's extract step buffer and write whole batches at once.
+RESOURCE_BATCH_SIZE = 10_000
+
+
+def _iter_batches(items: list[dict], batch_size: int = RESOURCE_BATCH_SIZE) -> Iterator[list[dict]]:
+    """Yield consecutive slices of ``items`` with at most ``batch_size`` records each."""
+    for i in range(0, len(items), batch_size):
+        yield items[i : i + batch_size]
+
+
+# Arrow schemas for the footprint_data and countries resources (mirror the column hints)
+FOOTPRINT_ARROW_SCHEMA = pa.schema(
+    [
+        pa.field("country_code", pa.int64(), nullable=False),
+        pa.field("country_name", pa.string(), nullable=False),
+        ("short_name", pa.string()),
+        ("iso_alpha2", pa.string()),
+        pa.field("year", pa.int64(), nullable=False),
+        pa.field("record_type", pa.string(), nullable=False),
+        ("record_type_description", pa.string()),
+        ("crop_land", pa.float64()),
+        ("grazing_land", pa.float64()),
+        ("forest_land", pa.float64()),
+        ("fishing_ground", pa.float64()),
+        ("builtup_land", pa.float64()),
+        ("carbon", pa.float64()),
+        ("value", pa.float64()),
+        ("score", pa.string()),
+        ("extracted_at", pa.timestamp("us", tz="UTC")),
+    ]
+)
+
+COUNTRIES_ARROW_SCHEMA = pa.schema(
+    [
+        ("country_code", pa.int64()),
+        ("country_name", pa.string()),
+        ("short_name", pa.string()),
+        ("iso_alpha2", pa.string()),
+        ("version", pa.string()),
+        ("score", pa.string()),
+        ("extracted_at", pa.timestamp("us", tz="UTC")),
+    ]
+)
+
+
+def _to_arrow_table(records: list[dict], schema: pa.Schema = FOOTPRINT_ARROW_SCHEMA) -> pa.Table:
+    """Build an Arrow table column by column so dlt can skip row normalization."""
+    columns = []
+    for f in schema:
+        values = [r.get(f.name) for r in records]
+        if pa.types.is_timestamp(f.type):
+            # extracted_at is one ISO-8601 string per run: parse each distinct
+            # value once and broadcast it, instead of parsing every row
+            encoded = pa.array(values, type=pa.string()).dictionary_encode()
+            columns.append(encoded.dictionary.cast(f.type).take(encoded.indices))
+        elif pa.types.is_string(f.type):
+            try:
+                columns.append(pa.array(values, type=f.type))
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Text columns occasionally arrive as numbers; coerce like dlt would
+                values = [None if v is None else str(v) for v in values]
+                columns.append(pa.array(values, type=f.type))
+        else:
+            try:
+                columns.append(pa.array(values, type=f.type))
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Numeric columns occasionally arrive as text ("1.5"); parse
+                # them through Arrow's string cast as dlt's normalizer would
+                text = pa.array([None if v is None else str(v) for v in values], pa.string())
+                try:
+                    columns.append(text.cast(f.type))
+                except pa.ArrowInvalid as e:
+                    raise ValueError(f"Cannot coerce column {f.name!r} to {f.type}: {e}") from e
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _dedupe_footprint_records(records: list[dict]) -> list[dict]:
+    """Keep the last record per (country_code, year, record_type) primary key."""
+    latest = {(r["country_code"], r["year"], r["record_type"]): r for r in records}
+    return list(latest.values())
+
+
 @dlt.source(name="gfn", max_table_nesting=0)
 def gfn_source(
     api_key: str = dlt.secrets.value,
@@ -579,7 +811,7 @@ def gfn_source(
         use_dynamic_types: Always True - types are discovered from API
     """
     config = ExtractionConfig(api_key=api_key, use_dynamic_types=True)
-    data = asyncio.run(extract_all_data(config, start_year, end_year, record_types))
+    data = run_async(extract_all_data(config, start_year, end_year, record_types))
 
     yield countries_resource(data["countries"])
     yield record_types_resource(data["record_types"])
@@ -600,10 +832,10 @@ def gfn_source(
         "extracted_at": {"data_type": "timestamp", "nullable": True},
     },
 )
-def countries_resource(countries: list[dict]) -> Iterator[dict]:
-    """Countries reference data."""
+def countries_resource(countries: list[dict]) -> Iterator[pa.Table]:
+    """Countries reference data, yielded as a single Arrow table."""
     print(f"Loading {len(countries)} countries...")
-    yield from countries
+    yield _to_arrow_table(countries, COUNTRIES_ARROW_SCHEMA)
 
 
 @dlt.resource(
@@ -644,10 +876,12 @@ def record_types_resource(record_types: list[dict]) -> Iterator[dict]:
         "extracted_at": {"data_type": "timestamp", "nullable": True},
     },
 )
-def footprint_data_resource(data: list[dict]) -> Iterator[dict]:
-    """All footprint and biocapacity data."""
+def footprint_data_resource(data: list[dict]) -> Iterator[pa.Table]:
+    """All footprint and biocapacity data, yielded as Arrow tables."""
+    data = _dedupe_footprint_records(data)
     print(f"Loading {len(data):,} footprint records...")
-    yield from data
+    for batch in _iter_batches(data):
+        yield _to_arrow_table(batch)
 
 
 # ============================================================================
@@ -705,25 +939,39 @@ def run_pipeline(
     years_count = end_year - start_year + 1
     type_filter = f"{len(record_types)} types" if record_types else "all types (dynamic)"
 
-    print(f"\n{'=' * 70}")
-    print("GFN Pipeline - Bulk Extraction")
-    print(f"{'=' * 70}")
-    print(f"Destination:    {destination}")
-    print(f"Years:          {start_year}-{end_year} ({years_count} years)")
-    print(f"Record Types:   {type_filter}")
-    print(f"Mode:           {'Full Refresh' if full_refresh else 'Incremental Merge'}")
-    print(f"API Calls:      ~{years_count + 2} (bulk endpoint)")
-    print(f"{'=' * 70}\n")
+    # Emit each banner with a single write rather than one flush per line
+    print(
+        "\n".join(
+            [
+                f"\n{'=' * 70}",
+                "GFN Pipeline - Bulk Extraction",
+                f"{'=' * 70}",
+                f"Destination:    {destination}",
+                f"Years:          {start_year}-{end_year} ({years_count} years)",
+                f"Record Types:   {type_filter}",
+                f"Mode:           {'Full Refresh' if full_refresh else 'Incremental Merge'}",
+                f"API Calls:      ~{years_count + 2} (bulk endpoint)",
+                f"{'=' * 70}\n",
+            ]
+        )
+    )
 
     start_time = time.monotonic()
-    load_info = pipeline.run(source)
+    # Arrow batches from footprint_data go straight to Parquet load files
+    load_info = pipeline.run(source, loader_file_format="parquet")
     elapsed = time.monotonic() - start_time
 
-    print(f"\n{'=' * 70}")
-    print(f"COMPLETE in {elapsed:.1f}s")
-    print(f"{'=' * 70}")
-    print(load_info)
-    print(f"\nPipeline state: {pipeline.pipelines_dir}")
+    print(
+        "\n".join(
+            [
+                f"\n{'=' * 70}",
+                f"COMPLETE in {elapsed:.1f}s",
+                f"{'=' * 70}",
+                str(load_info),
+                f"\nPipeline state: {pipeline.pipelines_dir}",
+            ]
+        )
+    )
 
     return pipeline
 
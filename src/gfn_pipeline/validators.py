@@ -21,23 +21,70 @@ Usage:
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import pandas as pd
+import pyarrow as pa
 import yaml
 
+# Safe loading either way: libyaml's CSafeLoader when PyYAML was built with it,
+# otherwise the pure-Python SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml bindings
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger("gfn_pipeline.validators")
 
 
+# =============================================================================
+# Column Helpers
+# =============================================================================
+
+Records = pd.DataFrame | pa.Table | list[dict]
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_checks_file(path: str, mtime: float) -> dict[str, Any]:
+    """Parse a checks YAML file (cached per path and modification time)."""
+    with open(path) as f:
+        # _YamlLoader is a safe loader in both branches above
+        return yaml.load(f, Loader=_YamlLoader)  # nosec B506
+
+
+def _as_frame(records: Records) -> pd.DataFrame:
+    """Return records as a DataFrame, reusing DataFrames and Arrow tables as-is."""
+    if isinstance(records, pd.DataFrame):
+        return records
+    if isinstance(records, pa.Table):
+        return records.to_pandas()
+    return pd.DataFrame(records)
+
+
+def _column(df: pd.DataFrame, col: str) -> pd.Series:
+    """Return ``df[col]``, or an all-null column if it is absent."""
+    if col in df.columns:
+        return df[col]
+    return pd.Series(None, index=df.index, dtype=object)
+
+
+def _is_missing(values: pd.Series) -> pd.Series:
+    """Mask of null or empty ('' / 0) values, matching ``not r.get(col)``."""
+    return values.isna() | values.isin(["", 0])
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class SodaCheckResult:
     """Result of Soda data quality checks."""
 
@@ -83,6 +130,7 @@ class SodaStagingValidator:
         checks: Dictionary of check definitions loaded from YAML
         fail_on_error: If True, raise exception on check failure
         warn_only: If True, only warn on failures (don't fail pipeline)
+        n_failure_cases: Max offending values quoted per check (None = all)
     """
 
     DEFAULT_CHECKS_PATH = Path(__file__).parent.parent.parent / "soda" / "staging_checks.yml"
@@ -92,6 +140,7 @@ class SodaStagingValidator:
         checks_path: Path | str | None = None,
         fail_on_error: bool = True,
         warn_only: bool = False,
+        n_failure_cases: int | None = 10,
     ):
         """
         Initialize Soda validator.
@@ -100,11 +149,18 @@ class SodaStagingValidator:
             checks_path: Path to staging_checks.yml (default: soda/staging_checks.yml)
             fail_on_error: Raise exception if checks fail
             warn_only: Only warn on failures, don't fail pipeline
+            n_failure_cases: Max offending values quoted in each check message,
+                so messages stay small on pathological batches (None = all)
         """
         self.checks_path = Path(checks_path) if checks_path else self.DEFAULT_CHECKS_PATH
         self.fail_on_error = fail_on_error
         self.warn_only = warn_only
+        self.n_failure_cases = n_failure_cases
         self.checks = self._load_checks()
+        # Frozen once so each validate() call reuses the same hash set
+        self._valid_record_types = frozenset(
+            self.checks.get("footprint_data", {}).get("valid_record_types", ())
+        )
 
     def _load_checks(self) -> dict[str, Any]:
         """Load check definitions from YAML file."""
@@ -112,8 +168,10 @@ class SodaStagingValidator:
             logger.warning(f"Checks file not found: {self.checks_path}, using defaults")
             return self._default_checks()
 
-        with open(self.checks_path) as f:
-            checks = yaml.safe_load(f)
+        # Copy so a validator mutating its checks cannot affect the shared cache
+        checks = copy.deepcopy(
+            _parse_checks_file(str(self.checks_path), self.checks_path.stat().st_mtime)
+        )
 
         logger.debug(f"Loaded checks from {self.checks_path}")
         return checks
@@ -135,12 +193,13 @@ class SodaStagingValidator:
             },
         }
 
-    def validate(self, data: dict[str, list[dict]]) -> SodaCheckResult:
+    def validate(self, data: dict[str, Records]) -> SodaCheckResult:
         """
         Run Soda-style checks on staged data.
 
         Args:
-            data: Dictionary with 'countries' and 'footprint_data' lists
+            data: Dictionary with 'countries' and 'footprint_data' as lists of
+                records, DataFrames or Arrow tables
 
         Returns:
             SodaCheckResult with validation results
@@ -176,28 +235,29 @@ class SodaStagingValidator:
 
         return result
 
-    def _validate_footprint_data(self, records: list[dict]) -> SodaCheckResult:
+    def _validate_footprint_data(self, records: Records) -> SodaCheckResult:
         """Validate footprint_data records against check definitions."""
         result = SodaCheckResult(passed=True)
         checks = self.checks.get("footprint_data", {})
+        df = _as_frame(records)
 
         # Check 1: Row count
         if "row_count" in checks:
             result.checks_run += 1
             min_rows = checks["row_count"].get("min", 1)
-            if len(records) >= min_rows:
+            if len(df) >= min_rows:
                 result.checks_passed += 1
-                logger.debug(f"✓ footprint_data.row_count: {len(records)} records")
+                logger.debug(f"✓ footprint_data.row_count: {len(df)} records")
             else:
                 result.checks_failed += 1
                 result.failed_checks.append(
-                    f"footprint_data.row_count: expected >= {min_rows}, got {len(records)}"
+                    f"footprint_data.row_count: expected >= {min_rows}, got {len(df)}"
                 )
 
         # Check 2: Required columns (null check)
         for col in checks.get("required_columns", []):
             result.checks_run += 1
-            missing = sum(1 for r in records if not r.get(col))
+            missing = int(_is_missing(_column(df, col)).sum())
             if missing == 0:
                 result.checks_passed += 1
                 logger.debug(f"✓ footprint_data.{col}: no missing values")
@@ -211,37 +271,33 @@ class SodaStagingValidator:
             year_range = checks["valid_year_range"]
             min_year = year_range.get("min", 1960)
             max_year = year_range.get("max", 2030)
-            invalid_years = [
-                r
-                for r in records
-                if r.get("year") and (r["year"] < min_year or r["year"] > max_year)
-            ]
+            years = _column(df, "year")
+            present = years[~_is_missing(years)]
+            invalid_years = int(((present < min_year) | (present > max_year)).sum())
             if not invalid_years:
                 result.checks_passed += 1
                 logger.debug("✓ footprint_data.year: all values in valid range")
             else:
                 result.checks_failed += 1
                 result.failed_checks.append(
-                    f"footprint_data.year: {len(invalid_years)} values outside range [{min_year}, {max_year}]"
+                    f"footprint_data.year: {invalid_years} values outside range [{min_year}, {max_year}]"
                 )
 
         # Check 4: Valid record types
         if "valid_record_types" in checks:
             result.checks_run += 1
-            valid_types = set(checks["valid_record_types"])
-            invalid_types = [
-                r.get("record_type")
-                for r in records
-                if r.get("record_type") and r["record_type"] not in valid_types
-            ]
-            if not invalid_types:
+            record_types = _column(df, "record_type")
+            present = record_types[~_is_missing(record_types)]
+            invalid_types = present[~present.isin(self._valid_record_types)]
+            if invalid_types.empty:
                 result.checks_passed += 1
                 logger.debug("✓ footprint_data.record_type: all values valid")
             else:
-                unique_invalid = set(invalid_types)
+                unique_invalid = invalid_types.unique()
                 result.checks_warned += 1
                 result.warnings.append(
-                    f"footprint_data.record_type: {len(unique_invalid)} unknown types: {unique_invalid}"
+                    f"footprint_data.record_type: {len(unique_invalid)} unknown types: "
+                    f"{self._failure_cases(unique_invalid)}"
                 )
                 # Warning only - schema evolution may add new types
                 result.checks_passed += 1
@@ -249,61 +305,63 @@ class SodaStagingValidator:
         # Check 5: Non-negative values
         if checks.get("non_negative_value"):
             result.checks_run += 1
-            negative_values = [r for r in records if r.get("value") is not None and r["value"] < 0]
+            values = pd.to_numeric(_column(df, "value"), errors="coerce")
+            negative_values = int((values < 0).sum())
             if not negative_values:
                 result.checks_passed += 1
                 logger.debug("✓ footprint_data.value: all values non-negative")
             else:
                 result.checks_failed += 1
                 result.failed_checks.append(
-                    f"footprint_data.value: {len(negative_values)} negative values"
+                    f"footprint_data.value: {negative_values} negative values"
                 )
 
         # Check 6: Unique key (no duplicates)
         if "unique_key" in checks:
             result.checks_run += 1
             key_cols = checks["unique_key"]
-            seen_keys = set()
-            duplicates = 0
-            for r in records:
-                key = tuple(r.get(col) for col in key_cols)
-                if key in seen_keys:
-                    duplicates += 1
-                seen_keys.add(key)
+            keys = pd.DataFrame({col: _column(df, col) for col in key_cols}, index=df.index)
+            duplicates = int(keys.duplicated().sum())
 
             if duplicates == 0:
                 result.checks_passed += 1
                 logger.debug("✓ footprint_data.unique_key: no duplicates")
             else:
+                # keep=False flags every copy, so each offending key is quoted once
+                dup_keys = keys[keys.duplicated(keep=False)].drop_duplicates()
                 result.checks_failed += 1
                 result.failed_checks.append(
-                    f"footprint_data.unique_key: {duplicates} duplicate records"
+                    f"footprint_data.unique_key: {duplicates} duplicate records: "
+                    f"{self._failure_cases(map(tuple, dup_keys.to_numpy().tolist()))}"
                 )
 
         return result
 
-    def _validate_countries(self, records: list[dict]) -> SodaCheckResult:
+    def _validate_countries(self, records: Records) -> SodaCheckResult:
         """Validate countries records against check definitions."""
         result = SodaCheckResult(passed=True)
         checks = self.checks.get("countries", {})
+        df = _as_frame(records)
+        country_codes = _column(df, "country_code")
+        country_codes = country_codes[~_is_missing(country_codes)]
 
         # Check 1: Row count
         if "row_count" in checks:
             result.checks_run += 1
             min_rows = checks["row_count"].get("min", 1)
-            if len(records) >= min_rows:
+            if len(df) >= min_rows:
                 result.checks_passed += 1
-                logger.debug(f"✓ countries.row_count: {len(records)} records")
+                logger.debug(f"✓ countries.row_count: {len(df)} records")
             else:
                 result.checks_failed += 1
                 result.failed_checks.append(
-                    f"countries.row_count: expected >= {min_rows}, got {len(records)}"
+                    f"countries.row_count: expected >= {min_rows}, got {len(df)}"
                 )
 
         # Check 2: Required columns
         for col in checks.get("required_columns", []):
             result.checks_run += 1
-            missing = sum(1 for r in records if not r.get(col))
+            missing = int(_is_missing(_column(df, col)).sum())
             if missing == 0:
                 result.checks_passed += 1
                 logger.debug(f"✓ countries.{col}: no missing values")
@@ -314,20 +372,22 @@ class SodaStagingValidator:
         # Check 3: Unique country codes
         if "unique_key" in checks:
             result.checks_run += 1
-            country_codes = [r.get("country_code") for r in records if r.get("country_code")]
-            duplicates = len(country_codes) - len(set(country_codes))
+            duplicates = int(country_codes.duplicated().sum())
             if duplicates == 0:
                 result.checks_passed += 1
                 logger.debug("✓ countries.country_code: all unique")
             else:
                 result.checks_failed += 1
-                result.failed_checks.append(f"countries.country_code: {duplicates} duplicates")
+                dup_codes = country_codes[country_codes.duplicated(keep=False)].unique()
+                result.failed_checks.append(
+                    f"countries.country_code: {duplicates} duplicates: "
+                    f"{self._failure_cases(dup_codes.tolist())}"
+                )
 
         # Check 4: Minimum country coverage
         if "min_country_coverage" in checks:
             result.checks_run += 1
-            country_codes = [r.get("country_code") for r in records if r.get("country_code")]
-            unique_countries = len(set(country_codes))
+            unique_countries = country_codes.nunique()
             min_coverage = checks["min_country_coverage"]
             if unique_countries >= min_coverage:
                 result.checks_passed += 1
@@ -342,6 +402,14 @@ class SodaStagingValidator:
 
         return result
 
+    def _failure_cases(self, values) -> str:
+        """Format at most ``n_failure_cases`` offending values for a check message."""
+        values = list(values)
+        if self.n_failure_cases is None or len(values) <= self.n_failure_cases:
+            return str(values)
+        shown = values[: self.n_failure_cases]
+        return f"{shown} (+{len(values) - len(shown)} more)"
+
     def _merge_results(self, target: SodaCheckResult, source: SodaCheckResult):
         """Merge source results into target."""
         target.checks_run += source.checks_run
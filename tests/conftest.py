@@ -0,0 +1,166 @@
+"""
+Shared pytest fixtures for GFN Pipeline tests.
+
+Integration fixtures probe LocalStack once per test session so that each
+integration test only pays for its own AWS calls.
+"""
+
+import functools
+import socket
+
+import pytest
+
+LOCALSTACK_HOST = "localhost"
+LOCALSTACK_PORT = 4566
+LOCALSTACK_ENDPOINT = f"http://{LOCALSTACK_HOST}:{LOCALSTACK_PORT}"
+
+
+@functools.lru_cache(maxsize=1)
+def _localstack_healthy() -> bool:
+    """Return True if the LocalStack health endpoint answers 200 (probed once)."""
+    # A bare TCP connect settles the common "not running" case in about a
+    # millisecond, without importing requests or waiting on an HTTP timeout
+    try:
+        socket.create_connection((LOCALSTACK_HOST, LOCALSTACK_PORT), timeout=0.2).close()
+    except OSError:
+        return False
+
+    import requests
+
+    try:
+        with requests.Session() as session:
+            response = session.get(f"{LOCALSTACK_ENDPOINT}/_localstack/health", timeout=2)
+    except requests.exceptions.RequestException:
+        return False
+    return response.status_code == 200
+
+
+@pytest.fixture(scope="session")
+def localstack_available() -> bool:
+    """Whether LocalStack is running and healthy for this test session."""
+    return _localstack_healthy()
+
+
+@pytest.fixture(scope="session")
+def aws_session():
+    """boto3 session with LocalStack's dummy credentials."""
+    boto3 = pytest.importorskip("boto3")
+
+    return boto3.Session(
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+        region_name="us-east-1",
+    )
+
+
+def _localstack_client(aws_session, service_name: str):
+    """Create a fail-fast LocalStack client for ``service_name``."""
+    from botocore.config import Config
+
+    return aws_session.client(
+        service_name,
+        endpoint_url=LOCALSTACK_ENDPOINT,
+        config=Config(retries={"max_attempts": 1}),
+    )
+
+
+@pytest.fixture(scope="session")
+def s3_client(aws_session):
+    """Session-wide LocalStack S3 client."""
+    return _localstack_client(aws_session, "s3")
+
+
+@pytest.fixture(scope="session")
+def sqs_client(aws_session):
+    """Session-wide LocalStack SQS client."""
+    return _localstack_client(aws_session, "sqs")
+
+
+@pytest.fixture(scope="session")
+def lambda_client(aws_session):
+    """Session-wide LocalStack Lambda client."""
+    return _localstack_client(aws_session, "lambda")
+
+
+@pytest.fixture(scope="session")
+def sfn_client(aws_session):
+    """Session-wide LocalStack Step Functions client."""
+    return _localstack_client(aws_session, "stepfunctions")
+
+
+# Resource listings do not change during a run, so each is fetched once.
+# They depend on localstack_available because session fixtures are set up
+# before the per-class autouse skip fixtures.
+
+
+@pytest.fixture(scope="session")
+def bucket_names(localstack_available, s3_client) -> set[str]:
+    """Names of the S3 buckets in LocalStack."""
+    if not localstack_available:
+        pytest.skip("LocalStack not running")
+    return {b["Name"] for b in s3_client.list_buckets()["Buckets"]}
+
+
+@pytest.fixture(scope="session")
+def queue_urls(localstack_available, sqs_client) -> set[str]:
+    """URLs of the SQS queues in LocalStack."""
+    if not localstack_available:
+        pytest.skip("LocalStack not running")
+    return set(sqs_client.list_queues().get("QueueUrls", []))
+
+
+@pytest.fixture(scope="session")
+def function_names(localstack_available, lambda_client) -> set[str]:
+    """Names of the Lambda functions in LocalStack."""
+    if not localstack_available:
+        pytest.skip("LocalStack not running")
+    return {f["FunctionName"] for f in lambda_client.list_functions()["Functions"]}
+
+
+@pytest.fixture(scope="session")
+def state_machine_names(localstack_available, sfn_client) -> set[str]:
+    """Names of the Step Functions state machines in LocalStack."""
+    if not localstack_available:
+        pytest.skip("LocalStack not running")
+    return {sm["name"] for sm in sfn_client.list_state_machines()["stateMachines"]}
+
+
+@pytest.fixture
+def moto_aws(monkeypatch):
+    """
+    In-process S3 and SQS (moto) with the pipeline bucket and queues created.
+
+    The Lambda handlers default to the LocalStack endpoint, so it is cleared
+    for the test to let their boto3 clients reach moto's mocked AWS instead.
+    """
+    moto = pytest.importorskip("moto")
+    boto3 = pytest.importorskip("boto3")
+    from infrastructure import lambda_handlers
+
+    for name, value in {
+        "AWS_ACCESS_KEY_ID": "testing",
+        "AWS_SECRET_ACCESS_KEY": "testing",
+        "AWS_DEFAULT_REGION": lambda_handlers.AWS_REGION,
+    }.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.delenv("AWS_LAMBDA_FUNCTION_NAME", raising=False)
+    monkeypatch.setattr(lambda_handlers, "LOCALSTACK_ENDPOINT", None)
+
+    with moto.mock_aws():
+        s3 = boto3.client("s3", region_name=lambda_handlers.AWS_REGION)
+        sqs = boto3.client("sqs", region_name=lambda_handlers.AWS_REGION)
+        s3.create_bucket(Bucket=lambda_handlers.S3_BUCKET)
+        for queue in ("gfn-transform-queue", "gfn-load-queue"):
+            sqs.create_queue(QueueName=queue)
+        yield {"s3": s3, "sqs": sqs, "bucket": lambda_handlers.S3_BUCKET}
+
+
+@pytest.fixture(scope="session")
+def aws_resources(bucket_names, queue_urls, function_names, state_machine_names):
+    """All pre-fetched LocalStack listings, keyed by resource kind."""
+    return {
+        "buckets": bucket_names,
+        "queues": {url.rsplit("/", 1)[-1] for url in queue_urls},
+        "functions": function_names,
+        "state_machines": state_machine_names,
+    }
@@ -13,6 +13,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+duckdb = pytest.importorskip("duckdb")
+
 # ============================================================================
 # Unit Tests - Soda Staging Validators (validators.py)
 # ============================================================================
@@ -31,6 +33,21 @@ class TestSodaStagingValidator:
         assert "countries" in validator.checks
         assert "required_columns" in validator.checks["footprint_data"]
 
+    def test_validator_caches_parsed_checks(self, tmp_path):
+        """Test that the checks YAML is parsed once per path and mtime."""
+        from gfn_pipeline import validators
+
+        checks_path = tmp_path / "checks.yml"
+        checks_path.write_text("countries:\n  row_count:\n    min: 1\n")
+
+        with patch.object(validators.yaml, "load", wraps=validators.yaml.load) as load:
+            first = validators.SodaStagingValidator(checks_path=checks_path)
+            second = validators.SodaStagingValidator(checks_path=checks_path)
+
+        assert load.call_count == 1
+        assert first.checks == second.checks == {"countries": {"row_count": {"min": 1}}}
+        assert first.checks is not second.checks
+
     def test_validator_validates_footprint_data(self):
         """Test footprint_data validation passes with valid data."""
         from gfn_pipeline.validators import SodaStagingValidator
@@ -135,6 +152,34 @@ class TestSodaStagingValidator:
         assert result.checks_warned > 0
         assert any("unknown types" in warning for warning in result.warnings)
 
+    def test_validator_caps_reported_failure_cases(self):
+        """Test that check messages quote at most n_failure_cases offending values."""
+        from gfn_pipeline.validators import SodaStagingValidator
+
+        validator = SodaStagingValidator(fail_on_error=False, n_failure_cases=2)
+
+        data = {
+            "footprint_data": [
+                {
+                    "country_code": 1,
+                    "country_name": "Test",
+                    "year": 2020,
+                    "record_type": f"Unknown{i}",
+                    "value": 1.0,
+                }
+                for i in range(5)
+            ],
+            "countries": [{"country_code": 1, "country_name": "Test"}],
+        }
+
+        result = validator.validate(data)
+
+        warning = next(w for w in result.warnings if "unknown types" in w)
+        assert "5 unknown types" in warning
+        assert "Unknown0" in warning and "Unknown1" in warning
+        assert "Unknown4" not in warning
+        assert "(+3 more)" in warning
+
     def test_validator_fails_on_duplicates(self):
         """Test validation fails on duplicate records."""
         from gfn_pipeline.validators import SodaStagingValidator
@@ -164,7 +209,35 @@ class TestSodaStagingValidator:
         result = validator.validate(data)
 
         assert not result.passed
-        assert any("duplicate" in check.lower() for check in result.failed_checks)
+        assert (
+            "footprint_data.unique_key: 1 duplicate records: [(1, 2020, 'EFConsTotGHA')]"
+            in result.failed_checks
+        )
+
+    def test_validator_accepts_dataframe_and_arrow_inputs(self):
+        """Test that DataFrames and Arrow tables are validated like record lists."""
+        import pandas as pd
+        import pyarrow as pa
+
+        from gfn_pipeline.validators import SodaStagingValidator
+
+        validator = SodaStagingValidator(fail_on_error=False)
+        footprint = [
+            {"country_code": 1, "country_name": "Test", "year": 2020, "record_type": "EF"},
+            {"country_code": 1, "country_name": "Test", "year": 2020, "record_type": "EF"},
+        ]
+        countries = [{"country_code": 1, "country_name": "Test"}]
+
+        from_lists = validator.validate({"footprint_data": footprint, "countries": countries})
+        from_frames = validator.validate(
+            {
+                "footprint_data": pd.DataFrame(footprint),
+                "countries": pa.Table.from_pylist(countries),
+            }
+        )
+
+        assert from_frames.failed_checks == from_lists.failed_checks
+        assert any("duplicate" in check for check in from_frames.failed_checks)
 
     def test_validator_result_to_dict(self):
         """Test SodaCheckResult can be serialized to dict."""
@@ -190,6 +263,16 @@ class TestSodaStagingValidator:
 # ============================================================================
 
 
+def _closing_run(return_value):
+    """Stand-in for run_async that closes the coroutine instead of running it."""
+
+    def run(coro):
+        coro.close()
+        return return_value
+
+    return run
+
+
 class TestDynamicRecordTypeDiscovery:
     """Tests for dynamic record type discovery from API."""
 
@@ -251,16 +334,18 @@ class TestDynamicRecordTypeDiscovery:
         assert result["EF"]["name"] == "Ecological Footprint"
         assert result["EF"]["record"] == "EFConsTotGHA"
 
-    def test_get_record_types_sync_caches_result(self):
+    def test_get_record_types_sync_caches_result(self, tmp_path, monkeypatch):
         """Test that record types are cached after first fetch."""
         from gfn_pipeline.pipeline_async import clear_record_types_cache, get_record_types_sync
 
+        monkeypatch.setenv("GFN_CACHE_DIR", str(tmp_path))
+
         # Clear cache first
         clear_record_types_cache()
 
         # Mock the async fetch
-        with patch("gfn_pipeline.pipeline_async.asyncio.run") as mock_run:
-            mock_run.return_value = {"EFConsTotGHA": "Ecological Footprint"}
+        with patch("gfn_pipeline.pipeline_async.run_async") as mock_run:
+            mock_run.side_effect = _closing_run(({"EFConsTotGHA": "Ecological Footprint"}, True))
 
             result1 = get_record_types_sync("test_api_key")
             result2 = get_record_types_sync("test_api_key")
@@ -269,6 +354,62 @@ class TestDynamicRecordTypeDiscovery:
             assert mock_run.call_count == 1
             assert result1 == result2
 
+    def test_get_record_types_sync_uses_disk_cache(self, tmp_path, monkeypatch):
+        """Test that a fresh process reuses record types persisted to disk."""
+        from gfn_pipeline import pipeline_async
+
+        monkeypatch.setenv("GFN_CACHE_DIR", str(tmp_path))
+        pipeline_async.clear_record_types_cache()
+
+        with patch("gfn_pipeline.pipeline_async.run_async") as mock_run:
+            mock_run.side_effect = _closing_run(({"EFConsTotGHA": "Ecological Footprint"}, True))
+            pipeline_async.get_record_types_sync("test_api_key")
+
+            # Simulate a new process: in-memory cache gone, disk cache remains
+            pipeline_async.get_record_types_sync.cache_clear()
+            result = pipeline_async.get_record_types_sync("test_api_key")
+
+            assert mock_run.call_count == 1
+            assert result == {"EFConsTotGHA": "Ecological Footprint"}
+            assert (tmp_path / "record_types.json").exists()
+
+        pipeline_async.clear_record_types_cache()
+        assert not (tmp_path / "record_types.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_fallback_record_types_are_not_persisted(self, tmp_path, monkeypatch):
+        """Test that the /types-only fallback is returned but never written to disk."""
+        from gfn_pipeline import pipeline_async
+
+        monkeypatch.setenv("GFN_CACHE_DIR", str(tmp_path))
+        pipeline_async.clear_record_types_cache()
+
+        types_metadata = {"EF": {"name": "Ecological Footprint", "record": "EFConsTotGHA"}}
+        with (
+            patch.object(
+                pipeline_async,
+                "fetch_record_types_from_api",
+                AsyncMock(return_value=types_metadata),
+            ),
+            patch.object(
+                pipeline_async,
+                "discover_record_types_from_sample_year",
+                AsyncMock(return_value=set()),
+            ),
+        ):
+            result = await pipeline_async._discover_available_record_types(
+                MagicMock(), MagicMock(), "https://api.test.com"
+            )
+
+        assert result == ({"EFConsTotGHA": "Ecological Footprint"}, False)
+
+        with patch("gfn_pipeline.pipeline_async.run_async") as mock_run:
+            mock_run.side_effect = _closing_run(result)
+            assert pipeline_async.get_record_types_sync("test_api_key") == result[0]
+
+        assert not (tmp_path / "record_types.json").exists()
+        pipeline_async.clear_record_types_cache()
+
 
 class TestExtractionConfig:
     """Tests for extraction configuration."""
@@ -342,6 +483,152 @@ class TestTokenBucketRateLimiter:
         assert elapsed >= 0.05  # Should have waited ~0.1s
 
 
+class TestFetchYearsParallel:
+    """Tests for concurrent year fetching."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_years_parallel_collects_and_filters_all_years(self):
+        """Test that every year is collected and the record type filter is applied."""
+        from gfn_pipeline import pipeline_async
+
+        async def fake_fetch(session, auth, rate_limiter, base_url, year, descriptions, **kwargs):
+            return [
+                {"country_code": 1, "year": year, "record_type": "EFConsTotGHA"},
+                {"country_code": 1, "year": year, "record_type": "BiocapTotGHA"},
+            ]
+
+        with patch.object(pipeline_async, "fetch_year_all_data", side_effect=fake_fetch):
+            records = await pipeline_async.fetch_years_parallel(
+                MagicMock(),
+                MagicMock(),
+                MagicMock(),
+                "https://api.test.com",
+                [2018, 2019, 2020, 2021, 2022],
+                {},
+                batch_size=2,
+                record_types=["EFConsTotGHA"],
+            )
+
+        assert sorted(r["year"] for r in records) == [2018, 2019, 2020, 2021, 2022]
+        assert {r["record_type"] for r in records} == {"EFConsTotGHA"}
+
+    @pytest.mark.asyncio
+    async def test_fetch_years_parallel_raises_worker_errors(self):
+        """Test that a year failing with an unexpected error raises instead of hanging."""
+        import asyncio
+
+        from gfn_pipeline import pipeline_async
+
+        async def fake_fetch(session, auth, rate_limiter, base_url, year, descriptions, **kwargs):
+            if year == 2019:
+                raise ValueError("truncated body")
+            return [{"country_code": 1, "year": year, "record_type": "EFConsTotGHA"}]
+
+        with patch.object(pipeline_async, "fetch_year_all_data", side_effect=fake_fetch):
+            with pytest.raises(ValueError, match="truncated body"):
+                await asyncio.wait_for(
+                    pipeline_async.fetch_years_parallel(
+                        MagicMock(),
+                        MagicMock(),
+                        MagicMock(),
+                        "https://api.test.com",
+                        [2018, 2019, 2020, 2021],
+                        {},
+                        batch_size=2,
+                    ),
+                    timeout=5,
+                )
+
+    @pytest.mark.asyncio
+    async def test_fetch_year_all_data_retries_server_errors(self):
+        """Test that a transient 5xx response is retried before giving up."""
+        from gfn_pipeline import pipeline_async
+
+        unavailable = AsyncMock(status=503, headers={})
+        ok = AsyncMock(status=200, headers={})
+        ok.json = AsyncMock(
+            return_value=[
+                {"countryCode": "1", "countryName": "Armenia", "year": 2020, "record": "EF"}
+            ]
+        )
+
+        mock_session = MagicMock()
+        mock_session.get = MagicMock(
+            side_effect=[
+                AsyncMock(__aenter__=AsyncMock(return_value=unavailable)),
+                AsyncMock(__aenter__=AsyncMock(return_value=ok)),
+            ]
+        )
+        rate_limiter = MagicMock(acquire=AsyncMock())
+
+        with patch.object(pipeline_async.asyncio, "sleep", AsyncMock()):
+            records = await pipeline_async.fetch_year_all_data(
+                mock_session, MagicMock(), rate_limiter, "https://api.test.com", 2020, {}
+            )
+
+        assert mock_session.get.call_count == 2
+        assert [r["country_code"] for r in records] == [1]
+
+
+class TestFootprintArrowBatches:
+    """Tests for the Arrow batches yielded to dlt."""
+
+    def test_to_arrow_table_casts_columns(self):
+        """Test that records are converted to the footprint Arrow schema."""
+        import pyarrow as pa
+
+        from gfn_pipeline.pipeline_async import FOOTPRINT_ARROW_SCHEMA, _to_arrow_table
+
+        records = [
+            {
+                "country_code": 1,
+                "country_name": "Armenia",
+                "year": 2020,
+                "record_type": "EFConsTotGHA",
+                "carbon": 10,
+                "value": None,
+                "extracted_at": "2024-01-01T00:00:00+00:00",
+            }
+        ]
+
+        table = _to_arrow_table(records)
+
+        assert table.schema == FOOTPRINT_ARROW_SCHEMA
+        assert table.num_rows == 1
+        assert table.column("carbon").to_pylist() == [10.0]
+        assert table.column("value").to_pylist() == [None]
+        assert table.column("extracted_at").type == pa.timestamp("us", tz="UTC")
+        assert table.column("extracted_at").to_pylist() == [
+            datetime(2024, 1, 1, tzinfo=timezone.utc)
+        ]
+
+    def test_to_arrow_table_coerces_numeric_text_columns(self):
+        """Test that numeric values in text columns are stored as strings."""
+        from gfn_pipeline.pipeline_async import COUNTRIES_ARROW_SCHEMA, _to_arrow_table
+
+        countries = [
+            {"country_code": 1, "country_name": "Armenia", "version": 2023},
+            {"country_code": 2, "country_name": "Afghanistan", "version": None},
+        ]
+
+        table = _to_arrow_table(countries, COUNTRIES_ARROW_SCHEMA)
+
+        assert table.column("version").to_pylist() == ["2023", None]
+        assert table.column("country_code").to_pylist() == [1, 2]
+
+    def test_to_arrow_table_coerces_numeric_strings_in_numeric_columns(self):
+        """Test that numeric text in float columns is parsed and bad values name the column."""
+        from gfn_pipeline.pipeline_async import _to_arrow_table
+
+        record = {"country_code": 1, "country_name": "Armenia", "year": 2020, "record_type": "EF"}
+
+        table = _to_arrow_table([{**record, "carbon": "1.5"}, {**record, "carbon": 2.0}])
+        assert table.column("carbon").to_pylist() == [1.5, 2.0]
+
+        with pytest.raises(ValueError, match="'carbon'"):
+            _to_arrow_table([{**record, "carbon": "n/a"}])
+
+
 # ============================================================================
 # Unit Tests - Lambda Handlers (lambda_handlers.py)
 # ============================================================================
@@ -397,6 +684,18 @@ class TestLambdaExtractHandler:
         assert result["status"] == "no_data"
         assert result["records_count"] == 0
 
+    def test_extract_handler_requires_api_key(self, moto_aws, monkeypatch):
+        """Test extract handler fails before writing to S3 when no API key is set."""
+        from infrastructure import lambda_handlers
+
+        monkeypatch.setattr(lambda_handlers, "GFN_API_KEY", None)
+
+        with pytest.raises(ValueError, match="GFN_API_KEY"):
+            lambda_handlers.handler_extract({"start_year": 2024, "end_year": 2024})
+
+        listing = moto_aws["s3"].list_objects_v2(Bucket=moto_aws["bucket"])
+        assert listing["KeyCount"] == 0
+
 
 class TestLambdaTransformHandler:
     """Tests for Lambda transform handler."""
@@ -505,6 +804,24 @@ class TestLambdaTransformHandler:
         assert transformed_data is not None
         assert transformed_data["footprint_data"][0]["carbon_pct_of_total"] == 25.0
 
+    def test_transform_carbon_percentage_handles_missing_values(self):
+        """Test carbon percentage is None when carbon is missing or value is not positive."""
+        import pandas as pd
+
+        from infrastructure.lambda_handlers import _carbon_pct_of_total
+
+        records = [
+            {"carbon": 100, "value": 400},
+            {"carbon": None, "value": 400},
+            {"carbon": 100, "value": 0},
+            {"carbon": 100, "value": None},
+            {"value": 400},
+        ]
+
+        frame = pd.DataFrame(records, columns=["carbon", "value"])
+
+        assert _carbon_pct_of_total(frame) == [25.0, None, None, None, None]
+
     def test_transform_handles_sqs_event_wrapper(self):
         """Test transform handler handles SQS event format."""
         from infrastructure.lambda_handlers import handler_transform
@@ -536,6 +853,43 @@ class TestLambdaTransformHandler:
 
         assert result["status"] == "success"
 
+    def test_transform_handler_validates_data(self, moto_aws):
+        """Test transform handler reads raw S3 data and writes only valid records."""
+        from infrastructure.lambda_handlers import handler_transform
+
+        s3, sqs, bucket = moto_aws["s3"], moto_aws["sqs"], moto_aws["bucket"]
+        raw_data = {
+            "footprint_data": [
+                {"country_code": 1, "year": 2024, "record_type": "EF", "carbon": 1, "value": 4},
+                {"country_code": None, "year": 2024, "record_type": "EF"},  # Invalid
+                {"country_code": 2, "year": 0, "record_type": "EF"},  # Invalid
+                {"country_code": 1, "year": 2024, "record_type": "EF", "value": 9},  # Duplicate
+            ],
+            "countries": [{"country_code": 1, "country_name": "Armenia"}],
+            "record_types": ["EF"],
+        }
+        s3.put_object(Bucket=bucket, Key="raw/gfn_footprint_test.json", Body=json.dumps(raw_data))
+
+        result = handler_transform({"s3_bucket": bucket, "s3_key": "raw/gfn_footprint_test.json"})
+
+        assert result == {
+            "status": "success",
+            "records_count": 1,
+            "s3_key": "transformed/gfn_footprint_test_transformed.json",
+            "s3_bucket": bucket,
+        }
+
+        body = s3.get_object(Bucket=bucket, Key=result["s3_key"])["Body"].read()
+        transformed = json.loads(body)
+        assert [r["value"] for r in transformed["footprint_data"]] == [4]
+        assert transformed["footprint_data"][0]["carbon_pct_of_total"] == 25.0
+        assert transformed["countries"] == raw_data["countries"]
+        assert transformed["metadata"]["records_removed"] == 3
+
+        queue_url = sqs.get_queue_url(QueueName="gfn-load-queue")["QueueUrl"]
+        messages = sqs.receive_message(QueueUrl=queue_url)["Messages"]
+        assert json.loads(messages[0]["Body"])["s3_key"] == result["s3_key"]
+
 
 class TestLambdaLoadHandler:
     """Tests for Lambda load handler."""
@@ -592,6 +946,38 @@ class TestLambdaLoadHandler:
 
         assert result["destination"] == "snowflake"
 
+    def test_duckdb_bulk_load_replaces_on_primary_key(self, tmp_path):
+        """Test DuckDB bulk load ingests a registered frame and replaces by key."""
+        from infrastructure.lambda_handlers import _load_to_duckdb_bulk
+
+        db_path = str(tmp_path / "lambda.duckdb")
+        records = [
+            {
+                "country_code": 1,
+                "country_name": "Armenia",
+                "year": 2020,
+                "record_type": "EFConsTotGHA",
+                "value": 3.0,
+                "score": "3A",
+                "transformed_at": "2024-01-30T12:00:00+00:00",
+            },
+            {"country_code": 2, "year": 2020, "record_type": "BiocapTotGHA", "value": None},
+        ]
+
+        with patch.dict(os.environ, {"DUCKDB_PATH": db_path}):
+            assert _load_to_duckdb_bulk(records) == 2
+            assert _load_to_duckdb_bulk([{**records[0], "value": 6.0}]) == 1
+            # Duplicate keys within one batch: the last row wins
+            _load_to_duckdb_bulk([{**records[1], "value": 1.0}, {**records[1], "value": 2.0}])
+
+        conn = duckdb.connect(db_path)
+        rows = conn.execute(
+            "SELECT country_code, country_name, value FROM footprint_data ORDER BY country_code"
+        ).fetchall()
+        conn.close()
+
+        assert rows == [(1, "Armenia", 6.0), (2, None, 2.0)]
+
 
 # ============================================================================
 # Unit Tests - Legacy PipelineRunner (main.py)
@@ -674,6 +1060,28 @@ class TestPipelineRunnerTransform:
         assert result["footprint_data"][0]["country_code"] == 1
 
 
+class TestS3DataLake:
+    """Tests for the S3 data lake layer."""
+
+    def test_store_staged_uses_multipart_transfer(self):
+        """Test that staged payloads are uploaded through a multipart TransferConfig."""
+        from gfn_pipeline.main import S3_MULTIPART_CHUNK_BYTES, S3DataLake
+
+        lake = S3DataLake(bucket="test-bucket")
+        lake._client = MagicMock()
+
+        uri = lake.store_staged({"footprint_data": [{"country_code": 1}]})
+
+        lake._client.upload_fileobj.assert_called_once()
+        fileobj, bucket, key = lake._client.upload_fileobj.call_args.args
+        kwargs = lake._client.upload_fileobj.call_args.kwargs
+        assert json.loads(fileobj.getvalue()) == {"footprint_data": [{"country_code": 1}]}
+        assert uri == f"s3://{bucket}/{key}"
+        assert kwargs["ExtraArgs"]["ContentType"] == "application/json"
+        assert kwargs["ExtraArgs"]["Metadata"]["record_count"] == "1"
+        assert kwargs["Config"].multipart_threshold == S3_MULTIPART_CHUNK_BYTES
+
+
 class TestDuckDBLoad:
     """Tests for DuckDB loading via dlt.
 
@@ -690,7 +1098,6 @@ class TestDuckDBLoad:
     def test_dlt_load_creates_table(self, temp_duckdb):
         """Test that dlt load creates table if not exists."""
         import dlt
-        import duckdb
 
         from gfn_pipeline.main import gfn_s3_source
 
@@ -746,7 +1153,6 @@ class TestDuckDBLoad:
     def test_dlt_load_upserts(self, temp_duckdb):
         """Test that dlt load performs merge on duplicate keys."""
         import dlt
-        import duckdb
 
         from gfn_pipeline.main import gfn_s3_source
 
@@ -821,164 +1227,92 @@ class TestLocalStackIntegration:
     """Integration tests requiring LocalStack."""
 
     @pytest.fixture(autouse=True)
-    def check_localstack(self):
+    def check_localstack(self, localstack_available):
         """Skip if LocalStack is not running."""
-        import requests
-
-        try:
-            response = requests.get("http://localhost:4566/_localstack/health", timeout=2)
-            if response.status_code != 200:
-                pytest.skip("LocalStack not healthy")
-        except requests.exceptions.ConnectionError:
+        if not localstack_available:
             pytest.skip("LocalStack not running")
 
-    def test_s3_bucket_exists(self):
-        """Test S3 bucket is created."""
-        import boto3
+    @pytest.mark.parametrize(
+        ("kind", "expected"),
+        [
+            ("buckets", "gfn-data-lake"),
+            ("queues", "gfn-extract-queue"),
+            ("queues", "gfn-transform-queue"),
+            ("queues", "gfn-load-queue"),
+            ("functions", "gfn-extract"),
+            ("functions", "gfn-transform"),
+            ("functions", "gfn-load"),
+            ("state_machines", "gfn-pipeline-orchestrator"),
+        ],
+    )
+    def test_resource_exists(self, aws_resources, kind, expected):
+        """Test LocalStack setup created each bucket, queue, Lambda and state machine."""
+        assert expected in aws_resources[kind], f"{kind}: {expected} not found"
 
-        s3 = boto3.client(
-            "s3",
-            endpoint_url="http://localhost:4566",
-            aws_access_key_id="test",
-            aws_secret_access_key="test",
-            region_name="us-east-1",
-        )
 
-        buckets = s3.list_buckets()["Buckets"]
-        bucket_names = [b["Name"] for b in buckets]
+@pytest.fixture(scope="module")
+def etl_environment(localstack_available):
+    """Skip unless LocalStack and the API key are available; force DuckDB loads."""
+    # Check LocalStack
+    if not localstack_available:
+        pytest.skip("LocalStack not running")
 
-        assert "gfn-data-lake" in bucket_names
+    # Check API key
+    if not os.getenv("GFN_API_KEY"):
+        pytest.skip("GFN_API_KEY not set")
 
-    def test_sqs_queues_exist(self):
-        """Test SQS queues are created."""
-        import boto3
+    # Force DuckDB destination by unsetting Snowflake env vars for tests
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv("SNOWFLAKE_ACCOUNT", raising=False)
+        mp.delenv("AWS_LAMBDA_FUNCTION_NAME", raising=False)
+        yield
 
-        sqs = boto3.client(
-            "sqs",
-            endpoint_url="http://localhost:4566",
-            aws_access_key_id="test",
-            aws_secret_access_key="test",
-            region_name="us-east-1",
-        )
 
-        queues = sqs.list_queues()
-        queue_urls = queues.get("QueueUrls", [])
+# The stages are chained through module-scoped fixtures so the GFN API is
+# called once per run, however many tests inspect the extract/transform/load.
 
-        expected_queues = ["gfn-extract-queue", "gfn-transform-queue", "gfn-load-queue"]
-        for queue in expected_queues:
-            assert any(queue in url for url in queue_urls), f"Queue {queue} not found"
 
-    def test_lambda_functions_exist(self):
-        """Test Lambda functions are created."""
-        import boto3
+@pytest.fixture(scope="module")
+def extract_result(etl_environment):
+    """Extract a single year to LocalStack S3."""
+    from infrastructure.lambda_handlers import handler_extract
 
-        lambda_client = boto3.client(
-            "lambda",
-            endpoint_url="http://localhost:4566",
-            aws_access_key_id="test",
-            aws_secret_access_key="test",
-            region_name="us-east-1",
-        )
+    return handler_extract({"start_year": 2023, "end_year": 2023})
 
-        functions = lambda_client.list_functions()["Functions"]
-        function_names = [f["FunctionName"] for f in functions]
 
-        expected_functions = ["gfn-extract", "gfn-transform", "gfn-load"]
-        for func in expected_functions:
-            assert func in function_names, f"Lambda {func} not found"
+@pytest.fixture(scope="module")
+def transform_result(extract_result):
+    """Transform the extracted S3 object."""
+    from infrastructure.lambda_handlers import handler_transform
 
-    def test_step_functions_state_machine_exists(self):
-        """Test Step Functions state machine is created."""
-        import boto3
+    return handler_transform(
+        {"s3_bucket": extract_result["s3_bucket"], "s3_key": extract_result["s3_key"]}
+    )
 
-        sfn = boto3.client(
-            "stepfunctions",
-            endpoint_url="http://localhost:4566",
-            aws_access_key_id="test",
-            aws_secret_access_key="test",
-            region_name="us-east-1",
-        )
 
-        state_machines = sfn.list_state_machines()["stateMachines"]
-        sm_names = [sm["name"] for sm in state_machines]
+@pytest.fixture(scope="module")
+def load_result(transform_result):
+    """Load the transformed S3 object."""
+    from infrastructure.lambda_handlers import handler_load
 
-        assert "gfn-pipeline-orchestrator" in sm_names
+    return handler_load(
+        {"s3_bucket": transform_result["s3_bucket"], "s3_key": transform_result["s3_key"]}
+    )
 
 
 @pytest.mark.integration
 class TestEndToEndExtraction:
     """End-to-end extraction tests (require API key and LocalStack)."""
 
-    @pytest.fixture(autouse=True)
-    def check_prerequisites(self):
-        """Skip if prerequisites not met."""
-        import requests
-
-        # Check LocalStack
-        try:
-            response = requests.get("http://localhost:4566/_localstack/health", timeout=2)
-            if response.status_code != 200:
-                pytest.skip("LocalStack not healthy")
-        except requests.exceptions.ConnectionError:
-            pytest.skip("LocalStack not running")
-
-        # Check API key
-        if not os.getenv("GFN_API_KEY"):
-            pytest.skip("GFN_API_KEY not set")
-
-    @pytest.fixture(autouse=True)
-    def force_duckdb_destination(self, monkeypatch):
-        """Force DuckDB destination by unsetting Snowflake env vars for tests."""
-        monkeypatch.delenv("SNOWFLAKE_ACCOUNT", raising=False)
-        monkeypatch.delenv("AWS_LAMBDA_FUNCTION_NAME", raising=False)
-
-    def test_extract_single_year(self):
+    def test_extract_single_year(self, extract_result):
         """Test extracting a single year of data."""
-        from infrastructure.lambda_handlers import handler_extract
-
-        result = handler_extract(
-            {
-                "start_year": 2023,
-                "end_year": 2023,
-            }
-        )
-
-        assert result["status"] == "success"
-        assert result["records_count"] > 0
-        assert result["s3_key"] is not None
+        assert extract_result["status"] == "success"
+        assert extract_result["records_count"] > 0
+        assert extract_result["s3_key"] is not None
 
-    def test_full_etl_pipeline(self):
+    def test_full_etl_pipeline(self, extract_result, transform_result, load_result):
         """Test full ETL pipeline through all stages."""
-        from infrastructure.lambda_handlers import (
-            handler_extract,
-            handler_load,
-            handler_transform,
-        )
-
-        # Extract
-        extract_result = handler_extract(
-            {
-                "start_year": 2023,
-                "end_year": 2023,
-            }
-        )
         assert extract_result["status"] == "success"
-
-        # Transform
-        transform_result = handler_transform(
-            {
-                "s3_bucket": extract_result["s3_bucket"],
-                "s3_key": extract_result["s3_key"],
-            }
-        )
         assert transform_result["status"] == "success"
-
-        # Load
-        load_result = handler_load(
-            {
-                "s3_bucket": transform_result["s3_bucket"],
-                "s3_key": transform_result["s3_key"],
-            }
-        )
         assert load_result["status"] == "success"
         assert load_result["records_loaded"] > 0